@@ -0,0 +1,107 @@
+"""
+Hot indicator kernels.
+======================
+The fused indicator kernel lives here, separate from the MT5-dependent main
+module, so build_ext.py can import it for ahead-of-time compilation on a
+machine without a terminal installed.
+
+Import preference, fastest first:
+  1. ``mt5_kernels`` — AOT-compiled shared library built by build_ext.py
+     (native speed with zero JIT warmup on process start)
+  2. the numba JIT binding (native speed after a one-time compile)
+  3. the pure-Python function (no numba installed)
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from _njit import njit
+
+
+def _all_indicators_py(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       volume: np.ndarray, ema_fast_p: int, ema_slow_p: int,
+                       rsi_p: int, atr_p: int, vwap_p: int) -> Tuple[float, float, float, float, float, float, float]:
+    """
+    Fused single-pass kernel for every indicator recurrence.
+
+    Walks the OHLCV arrays once instead of five times, carrying scalar state
+    for both EMAs, the Wilder gain/loss averages and the Wilder ATR, then
+    accumulates the VWAP sums over the trailing window. Returns
+    (ema_fast, ema_slow, avg_gain, avg_loss, atr, tpv_sum, vol_sum).
+    """
+    n = len(close)
+    alpha_f = 2.0 / (ema_fast_p + 1)
+    alpha_s = 2.0 / (ema_slow_p + 1)
+
+    # Seeds: SMA for the EMAs, simple means for Wilder gain/loss and ATR
+    ema_f = 0.0
+    for i in range(ema_fast_p):
+        ema_f += close[i]
+    ema_f /= ema_fast_p
+
+    ema_s = 0.0
+    for i in range(ema_slow_p):
+        ema_s += close[i]
+    ema_s /= ema_slow_p
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, rsi_p + 1):
+        d = close[i] - close[i - 1]
+        if d > 0.0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= rsi_p
+    avg_loss /= rsi_p
+
+    atr = 0.0
+    for i in range(1, atr_p + 1):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        atr += max(hl, max(hc, lc))
+    atr /= atr_p
+
+    # Single fused walk: each recurrence engages past its seed index
+    for i in range(1, n):
+        c = close[i]
+        prev = close[i - 1]
+
+        if i >= ema_fast_p:
+            ema_f = alpha_f * c + (1.0 - alpha_f) * ema_f
+        if i >= ema_slow_p:
+            ema_s = alpha_s * c + (1.0 - alpha_s) * ema_s
+
+        if i >= rsi_p + 1:
+            d = c - prev
+            gain = d if d > 0.0 else 0.0
+            loss = -d if d < 0.0 else 0.0
+            avg_gain = (avg_gain * (rsi_p - 1) + gain) / rsi_p
+            avg_loss = (avg_loss * (rsi_p - 1) + loss) / rsi_p
+
+        if i >= atr_p + 1:
+            hl = high[i] - low[i]
+            hc = abs(high[i] - prev)
+            lc = abs(low[i] - prev)
+            atr = (atr * (atr_p - 1) + max(hl, max(hc, lc))) / atr_p
+
+    # VWAP sums over the trailing window
+    tpv_sum = 0.0
+    vol_sum = 0.0
+    for i in range(n - vwap_p, n):
+        tp = (high[i] + low[i] + close[i]) / 3.0
+        tpv_sum += tp * volume[i]
+        vol_sum += volume[i]
+
+    return ema_f, ema_s, avg_gain, avg_loss, atr, tpv_sum, vol_sum
+
+
+all_indicators = njit(cache=True, fastmath=True)(_all_indicators_py)
+
+try:
+    # Prefer the precompiled shared library when build_ext.py has been run
+    from mt5_kernels import all_indicators  # noqa: F811
+except ImportError:
+    pass
@@ -0,0 +1,19 @@
+"""
+Optional Numba acceleration shim.
+==================================
+Exposes ``njit`` from numba when it is installed, otherwise a no-op
+decorator so the signal generator keeps working (slower) without it.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator: returns the function unchanged."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+
+        return wrapper
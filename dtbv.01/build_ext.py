@@ -0,0 +1,26 @@
+"""
+Ahead-of-time compilation of the hot indicator kernels.
+========================================================
+Run ``python build_ext.py`` once after install to produce the
+``mt5_kernels`` shared library next to this file. The signal generator
+then imports the precompiled kernel at startup with zero JIT warmup, so
+the first signal of the session is not delayed by compilation.
+
+Entirely optional: without the library the kernels fall back to the
+numba JIT (or pure Python). Requires a numba release that still ships
+``numba.pycc`` (removed upstream in 0.62+).
+"""
+
+from numba.pycc import CC
+
+from _kernels import _all_indicators_py
+
+cc = CC('mt5_kernels')
+cc.export(
+    'all_indicators',
+    'Tuple((f8,f8,f8,f8,f8,f8,f8))(f4[:],f4[:],f4[:],f4[:],f4[:],i8,i8,i8,i8,i8)'
+)(_all_indicators_py)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -10,14 +10,16 @@ Disclaimer: Not financial advice. User assumes all trading risk.
 """
 
 import MetaTrader5 as mt5
-import pandas as pd
 import numpy as np
-from datetime import datetime, time, timedelta
-import csv
+from datetime import datetime, time
+import atexit
 import os
 import sys
 from typing import Optional, Dict, Tuple
 
+from _kernels import all_indicators as _all_indicators
+from _njit import njit
+
 
 # ============================================================================
 # USER CONFIGURATION SECTION - SAFE TO MODIFY
@@ -54,6 +56,13 @@ class TradingConfig:
     LONDON_END = time(16, 0)
     NY_START = time(12, 0)
     NY_END = time(21, 0)
+
+    # Session windows as minutes-since-midnight, precomputed for fast
+    # integer comparison in the session filter
+    LONDON_RANGE = (LONDON_START.hour * 60 + LONDON_START.minute,
+                    LONDON_END.hour * 60 + LONDON_END.minute)
+    NY_RANGE = (NY_START.hour * 60 + NY_START.minute,
+                NY_END.hour * 60 + NY_END.minute)
     
     # Signal management
     COOLDOWN_MINUTES = 30  # Minimum minutes between signals
@@ -71,6 +80,35 @@ class TradingConfig:
 # TECHNICAL INDICATORS
 # ============================================================================
 
+@njit(cache=True)
+def _rsi_loop(gains: np.ndarray, losses: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gain/loss recurrence (jitted when numba is available)."""
+    n = len(gains) + 1
+    avg_gain = np.zeros(n)
+    avg_loss = np.zeros(n)
+
+    avg_gain[period] = np.mean(gains[:period])
+    avg_loss[period] = np.mean(losses[:period])
+
+    for i in range(period + 1, n):
+        avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gains[i - 1]) / period
+        avg_loss[i] = (avg_loss[i - 1] * (period - 1) + losses[i - 1]) / period
+
+    return avg_gain, avg_loss
+
+
+@njit(cache=True)
+def _atr_loop(tr: np.ndarray, period: int) -> np.ndarray:
+    """Wilder-smoothed ATR recurrence over a true-range array (jitted when numba is available)."""
+    atr = np.zeros_like(tr)
+    atr[period] = np.mean(tr[1:period + 1])
+
+    for i in range(period + 1, len(tr)):
+        atr[i] = (atr[i - 1] * (period - 1) + tr[i]) / period
+
+    return atr
+
+
 class Indicators:
     """
     Pure mathematical indicator calculations.
@@ -89,16 +127,25 @@ class Indicators:
         Returns:
             EMA values as numpy array
         """
+        # Imported here so scipy stays an optional dependency: the live
+        # pipeline goes through the fused kernel and never reaches this
+        from scipy import signal as sp_signal
+
         ema = np.zeros_like(data)
-        multiplier = 2.0 / (period + 1)
-        
+        alpha = 2.0 / (period + 1)
+
         # Initialize with SMA
-        ema[period - 1] = np.mean(data[:period])
-        
-        # Calculate EMA
-        for i in range(period, len(data)):
-            ema[i] = (data[i] - ema[i - 1]) * multiplier + ema[i - 1]
-        
+        sma_seed = np.mean(data[:period])
+        ema[period - 1] = sma_seed
+
+        # EMA is a first-order IIR filter: y[n] = alpha*x[n] + (1-alpha)*y[n-1].
+        # lfilter runs the recurrence in compiled C instead of a Python loop.
+        ema[period:], _ = sp_signal.lfilter(
+            [alpha], [1.0, alpha - 1.0],
+            data[period:],
+            zi=np.array([sma_seed * (1.0 - alpha)])
+        )
+
         return ema
     
     @staticmethod
@@ -113,22 +160,15 @@ class Indicators:
         Returns:
             RSI values (0-100) as numpy array
         """
-        deltas = np.diff(data)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.zeros(len(data))
-        avg_loss = np.zeros(len(data))
-        
-        # Initial averages
-        avg_gain[period] = np.mean(gains[:period])
-        avg_loss[period] = np.mean(losses[:period])
-        
-        # Smooth averages
-        for i in range(period + 1, len(data)):
-            avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gains[i - 1]) / period
-            avg_loss[i] = (avg_loss[i - 1] * (period - 1) + losses[i - 1]) / period
-        
+        # Split deltas into gains/losses without np.diff/np.where temporaries
+        deltas = np.empty(len(data) - 1, dtype=data.dtype)
+        np.subtract(data[1:], data[:-1], out=deltas)
+        gains = np.clip(deltas, 0, None)
+        np.negative(deltas, out=deltas)
+        losses = np.clip(deltas, 0, None)
+
+        avg_gain, avg_loss = _rsi_loop(gains, losses, period)
+
         rs = np.divide(avg_gain, avg_loss, out=np.zeros_like(avg_gain), where=avg_loss != 0)
         rsi = 100 - (100 / (1 + rs))
         
@@ -149,48 +189,49 @@ class Indicators:
             ATR values as numpy array
         """
         tr = np.zeros(len(close))
-        
-        for i in range(1, len(close)):
-            tr[i] = max(
-                high[i] - low[i],
-                abs(high[i] - close[i - 1]),
-                abs(low[i] - close[i - 1])
+        tr[1:] = np.maximum(
+            high[1:] - low[1:],
+            np.maximum(
+                np.abs(high[1:] - close[:-1]),
+                np.abs(low[1:] - close[:-1])
             )
-        
-        atr = np.zeros_like(tr)
-        atr[period] = np.mean(tr[1:period + 1])
-        
-        for i in range(period + 1, len(tr)):
-            atr[i] = (atr[i - 1] * (period - 1) + tr[i]) / period
-        
-        return atr
+        )
+
+        return _atr_loop(tr, period)
     
     @staticmethod
-    def vwap(high: np.ndarray, low: np.ndarray, close: np.ndarray, 
-             volume: np.ndarray, period: int) -> np.ndarray:
+    def vwap(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+             volume: np.ndarray, period: int,
+             typical_price: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Volume Weighted Average Price (rolling).
-        
+
         Args:
             high: High prices
             low: Low prices
             close: Close prices
             volume: Volume data
             period: Lookback period
-            
+            typical_price: Optional precomputed (high+low+close)/3 array so
+                callers that already have it avoid recomputing it here
+
         Returns:
             VWAP values as numpy array
         """
-        typical_price = (high + low + close) / 3
+        if typical_price is None:
+            typical_price = (high + low + close) / 3
         vwap = np.zeros(len(close))
-        
-        for i in range(period - 1, len(close)):
-            start_idx = max(0, i - period + 1)
-            tp_slice = typical_price[start_idx:i + 1]
-            vol_slice = volume[start_idx:i + 1]
-            
-            vwap[i] = np.sum(tp_slice * vol_slice) / np.sum(vol_slice) if np.sum(vol_slice) > 0 else close[i]
-        
+
+        # Rolling sums via prefix sums: O(N) instead of O(N * period)
+        tpv = typical_price * volume
+        csum_tpv = np.concatenate(([0.0], np.cumsum(tpv)))
+        csum_vol = np.concatenate(([0.0], np.cumsum(volume)))
+
+        num = csum_tpv[period:] - csum_tpv[:-period]
+        den = csum_vol[period:] - csum_vol[:-period]
+
+        vwap[period - 1:] = np.where(den > 0, num / np.where(den > 0, den, 1.0), close[period - 1:])
+
         return vwap
 
 
@@ -220,21 +261,21 @@ class MarketStructure:
             return None
         
         recent_lows = low[-lookback:]
-        
-        # Find local minima (swing lows)
-        swings = []
-        for i in range(2, len(recent_lows) - 2):
-            if (recent_lows[i] < recent_lows[i - 1] and 
-                recent_lows[i] < recent_lows[i - 2] and
-                recent_lows[i] < recent_lows[i + 1] and
-                recent_lows[i] < recent_lows[i + 2]):
-                swings.append(recent_lows[i])
-        
+
+        # Find local minima (swing lows): 5-bar fractal test, vectorized over
+        # all candidate windows at once. A pivot is the window minimum with a
+        # strict drop from the bar before it — equal far neighbors no longer
+        # disqualify an otherwise valid low, unlike the old 4-way strict test.
+        windows = np.lib.stride_tricks.sliding_window_view(recent_lows, 5)
+        center = windows[:, 2]
+        mask = (center == windows.min(axis=1)) & (center < windows[:, 1])
+        swings = center[mask]
+
         if len(swings) >= 2:
             # Check if we have a higher low pattern
             if swings[-1] > swings[-2]:
                 return swings[-1]
-        
+
         return None
     
     @staticmethod
@@ -274,21 +315,19 @@ class SessionFilter:
         Returns:
             (is_valid, session_name) tuple
         """
-        current_time = dt.time()
-        
-        # London session
-        if config.LONDON_START <= current_time <= config.LONDON_END:
+        minute = dt.hour * 60 + dt.minute
+
+        in_london = config.LONDON_RANGE[0] <= minute <= config.LONDON_RANGE[1]
+        in_ny = config.NY_RANGE[0] <= minute <= config.NY_RANGE[1]
+
+        # Overlap (most liquid) must be checked first or it is unreachable
+        if in_london and in_ny:
+            return True, "LONDON_NY_OVERLAP"
+        if in_london:
             return True, "LONDON"
-        
-        # New York session
-        if config.NY_START <= current_time <= config.NY_END:
+        if in_ny:
             return True, "NEW_YORK"
-        
-        # Overlap (most liquid)
-        if (config.LONDON_START <= current_time <= config.LONDON_END and
-            config.NY_START <= current_time <= config.NY_END):
-            return True, "LONDON_NY_OVERLAP"
-        
+
         return False, "CLOSED"
 
 
@@ -300,18 +339,102 @@ class SignalGenerator:
     """
     Core signal generation logic with comprehensive validation.
     """
-    
+
+    # Bit positions reported by the compiled scalar predicate
+    _FAIL_TREND = 1 << 0
+    _FAIL_RSI = 1 << 1
+    _FAIL_VWAP = 1 << 2
+    _FAIL_ATR = 1 << 3
+
     def __init__(self, config: TradingConfig):
         self.config = config
         self.last_signal_time = None
         self.last_signal_bar = None
-        
-    def get_market_data(self) -> Optional[pd.DataFrame]:
+        self._last_bar_time = None
+        self._state = None
+        self._predicate = self._compile_predicate()
+        self.refresh_symbol_meta()
+
+        # Structure-of-arrays bar buffers: fixed-size contiguous arrays,
+        # refilled in place on every fetch so the steady state allocates
+        # nothing per tick
+        n_bars = config.MIN_BARS_REQUIRED
+        self._high = np.empty(n_bars, dtype=np.float32)
+        self._low = np.empty(n_bars, dtype=np.float32)
+        self._close = np.empty(n_bars, dtype=np.float32)
+        self._volume = np.empty(n_bars, dtype=np.float32)
+        self._time = np.empty(n_bars, dtype=np.int64)
+
+    def _compile_predicate(self):
+        """
+        Build a config-specialized scalar filter via codegen.
+
+        The thresholds are fixed for the process lifetime, so they are baked
+        into the generated source as literals: the common NO-TRADE path then
+        runs a handful of comparisons with no attribute lookups, no f-string
+        formatting and no list allocation. Returns a function mapping
+        (ema_fast, ema_slow, price, rsi, vwap, atr) to a bitmask of failed
+        conditions, 0 meaning all scalar filters passed.
+        """
+        cfg = self.config
+        src = (
+            "def _predicate(ema_fast, ema_slow, price, rsi, vwap, atr):\n"
+            "    mask = 0\n"
+            "    if not (ema_fast > ema_slow and price > ema_fast and price > ema_slow):\n"
+            f"        mask |= {self._FAIL_TREND}\n"
+            f"    if not ({cfg.RSI_LOWER!r} < rsi < {cfg.RSI_UPPER!r}):\n"
+            f"        mask |= {self._FAIL_RSI}\n"
+            "    if not (price > vwap):\n"
+            f"        mask |= {self._FAIL_VWAP}\n"
+            f"    if not (atr > {cfg.MIN_ATR_MULTIPLIER!r}):\n"
+            f"        mask |= {self._FAIL_ATR}\n"
+            "    return mask\n"
+        )
+        namespace = {}
+        exec(compile(src, '<signal-predicate>', 'exec'), namespace)
+        return namespace['_predicate']
+
+    def _describe_failures(self, mask: int, indicators: Dict) -> list:
+        """
+        Decode a predicate bitmask into the human-readable failure messages.
+        Only called on the (already doomed) NO-TRADE path, so the formatting
+        cost stays off the hot path.
+        """
+        messages = []
+        if mask & self._FAIL_TREND:
+            messages.append(
+                f"No uptrend (EMA{self.config.EMA_FAST}={indicators['ema_fast']:.5f}, "
+                f"EMA{self.config.EMA_SLOW}={indicators['ema_slow']:.5f}, Price={indicators['price']:.5f})"
+            )
+        if mask & self._FAIL_RSI:
+            messages.append(
+                f"RSI out of range ({indicators['rsi']:.1f} not in {self.config.RSI_LOWER}-{self.config.RSI_UPPER})"
+            )
+        if mask & self._FAIL_VWAP:
+            messages.append(
+                f"Price below VWAP (Price={indicators['price']:.5f}, VWAP={indicators['vwap']:.5f})"
+            )
+        if mask & self._FAIL_ATR:
+            messages.append(
+                f"ATR too low ({indicators['atr']:.5f} < {self.config.MIN_ATR_MULTIPLIER})"
+            )
+        return messages
+
+    def refresh_symbol_meta(self):
+        """
+        Cache static symbol metadata (point size) to avoid an MT5 IPC
+        round-trip on every signal evaluation. Call again if the broker
+        changes contract specifications.
+        """
+        symbol_info = mt5.symbol_info(self.config.SYMBOL)
+        self._point = symbol_info.point if symbol_info is not None else None
+
+    def get_market_data(self) -> Optional[np.ndarray]:
         """
         Fetch market data from MT5 with validation.
-        
+
         Returns:
-            DataFrame with OHLCV data or None if error
+            Structured array of OHLCV bars (as returned by MT5) or None if error
         """
         try:
             rates = mt5.copy_rates_from_pos(
@@ -320,68 +443,184 @@ class SignalGenerator:
                 0,
                 self.config.MIN_BARS_REQUIRED
             )
-            
+
             if rates is None or len(rates) < self.config.MIN_BARS_REQUIRED:
                 print(f"❌ ERROR: Insufficient data. Got {len(rates) if rates is not None else 0} bars, need {self.config.MIN_BARS_REQUIRED}")
                 return None
-            
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
-            
-            return df
-            
+
+            # Scatter the structured array into the SoA buffers in place
+            # (float64 -> float32 for prices, integer volume/time kept as-is)
+            rates = rates[-self.config.MIN_BARS_REQUIRED:]
+            np.copyto(self._high, rates['high'])
+            np.copyto(self._low, rates['low'])
+            np.copyto(self._close, rates['close'])
+            np.copyto(self._volume, rates['tick_volume'], casting='unsafe')
+            np.copyto(self._time, rates['time'], casting='unsafe')
+
+            return rates
+
         except Exception as e:
             print(f"❌ ERROR fetching market data: {e}")
             return None
     
-    def calculate_indicators(self, df: pd.DataFrame) -> Dict:
+    def calculate_indicators(self) -> Dict:
         """
-        Calculate all required technical indicators.
-        
-        Args:
-            df: Market data DataFrame
-            
+        Calculate all required technical indicators from the SoA bar buffers
+        filled by get_market_data.
+
+        On the first call (or after a data gap) every indicator is computed
+        over the full buffer and the final recurrence state is cached. When
+        exactly one new bar has arrived since the previous call, each
+        indicator is advanced with a single O(1) update instead of an O(N)
+        recompute.
+
         Returns:
             Dictionary of indicator values
         """
-        close = df['close'].values
-        high = df['high'].values
-        low = df['low'].values
-        volume = df['tick_volume'].values
-        
-        ema_fast = Indicators.ema(close, self.config.EMA_FAST)
-        ema_slow = Indicators.ema(close, self.config.EMA_SLOW)
-        rsi = Indicators.rsi(close, self.config.RSI_PERIOD)
-        atr = Indicators.atr(high, low, close, self.config.ATR_PERIOD)
-        vwap = Indicators.vwap(high, low, close, volume, self.config.VWAP_PERIOD)
-        
+        close = self._close
+        high = self._high
+        low = self._low
+        volume = self._volume
+        # Bar times stay as unix seconds throughout; they are only turned
+        # into datetimes for display
+        t_last_s = int(self._time[-1])
+
+        # Incremental path: exactly one bar ahead of the cached state
+        if self._state is not None and self._last_bar_time is not None:
+            bar_step = t_last_s - int(self._time[-2])
+            if t_last_s - self._last_bar_time == bar_step:
+                self._last_bar_time = t_last_s
+                return self._update_indicators(high, low, close, volume[-1], t_last_s)
+
+        # One fused pass over the arrays computes every recurrence at once
+        (ema_fast, ema_slow, avg_gain, avg_loss, atr,
+         tpv_sum, vol_sum) = _all_indicators(
+            high, low, close, volume,
+            self.config.EMA_FAST, self.config.EMA_SLOW,
+            self.config.RSI_PERIOD, self.config.ATR_PERIOD,
+            self.config.VWAP_PERIOD
+        )
+
+        rs = avg_gain / avg_loss if avg_loss != 0 else 0.0
+        rsi = 100.0 - (100.0 / (1.0 + rs))
+        vwap = tpv_sum / vol_sum if vol_sum > 0 else float(close[-1])
+
+        self._seed_state(high, low, close, volume,
+                         ema_fast, ema_slow, avg_gain, avg_loss, atr)
+        self._last_bar_time = t_last_s
+
         return {
-            'ema_fast': ema_fast[-1],
-            'ema_slow': ema_slow[-1],
-            'rsi': rsi[-1],
-            'atr': atr[-1],
-            'vwap': vwap[-1],
-            'price': close[-1],
+            'ema_fast': float(ema_fast),
+            'ema_slow': float(ema_slow),
+            'rsi': float(rsi),
+            'atr': float(atr),
+            'vwap': float(vwap),
+            'price': float(close[-1]),
             'high': high,
             'low': low,
-            'time': df['time'].iloc[-1]
+            'time': t_last_s
+        }
+
+    def _seed_state(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    volume: np.ndarray, ema_fast: float, ema_slow: float,
+                    avg_gain: float, avg_loss: float, atr: float):
+        """
+        Cache the recurrence state of every indicator after a full recompute
+        so later bars can be applied incrementally.
+        """
+        period = self.config.VWAP_PERIOD
+
+        # VWAP ring buffers hold the contributions of the last `period` bars;
+        # position 0 is the oldest bar and is the first to be evicted.
+        # Rings stay float64: the running sums accumulate across many updates.
+        # The typical-price tail is computed once here; every later bar only
+        # contributes its own (h+l+c)/3 in _update_indicators.
+        typical_price_tail = (high[-period:] + low[-period:] + close[-period:]) / 3
+        tpv_ring = (typical_price_tail * volume[-period:]).astype(np.float64)
+        vol_ring = volume[-period:].astype(np.float64)
+
+        self._state = {
+            'ema_fast': float(ema_fast),
+            'ema_slow': float(ema_slow),
+            'avg_gain': float(avg_gain),
+            'avg_loss': float(avg_loss),
+            'atr': float(atr),
+            'prev_close': float(close[-1]),
+            'tpv_ring': tpv_ring,
+            'vol_ring': vol_ring,
+            'tpv_sum': tpv_ring.sum(),
+            'vol_sum': vol_ring.sum(),
+            'ring_pos': 0
+        }
+
+    def _update_indicators(self, high: np.ndarray, low: np.ndarray,
+                           close: np.ndarray, vol_new: float, t_last_s: int) -> Dict:
+        """
+        Advance every indicator by one bar in O(1) using the cached state.
+        """
+        cfg = self.config
+        st = self._state
+        h, l, c = float(high[-1]), float(low[-1]), float(close[-1])
+        vol_new = float(vol_new)
+        prev_close = st['prev_close']
+
+        # EMAs
+        alpha_fast = 2.0 / (cfg.EMA_FAST + 1)
+        alpha_slow = 2.0 / (cfg.EMA_SLOW + 1)
+        st['ema_fast'] = alpha_fast * c + (1.0 - alpha_fast) * st['ema_fast']
+        st['ema_slow'] = alpha_slow * c + (1.0 - alpha_slow) * st['ema_slow']
+
+        # RSI (Wilder)
+        delta = c - prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        st['avg_gain'] = (st['avg_gain'] * (cfg.RSI_PERIOD - 1) + gain) / cfg.RSI_PERIOD
+        st['avg_loss'] = (st['avg_loss'] * (cfg.RSI_PERIOD - 1) + loss) / cfg.RSI_PERIOD
+        rs = st['avg_gain'] / st['avg_loss'] if st['avg_loss'] != 0 else 0.0
+        rsi = 100.0 - (100.0 / (1.0 + rs))
+
+        # ATR (Wilder)
+        tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+        st['atr'] = (st['atr'] * (cfg.ATR_PERIOD - 1) + tr) / cfg.ATR_PERIOD
+
+        # VWAP: evict the oldest bar from the ring, push the new one
+        tpv_new = (h + l + c) / 3.0 * vol_new
+        idx = st['ring_pos']
+        st['tpv_sum'] += tpv_new - st['tpv_ring'][idx]
+        st['vol_sum'] += vol_new - st['vol_ring'][idx]
+        st['tpv_ring'][idx] = tpv_new
+        st['vol_ring'][idx] = vol_new
+        st['ring_pos'] = (idx + 1) % cfg.VWAP_PERIOD
+        vwap = st['tpv_sum'] / st['vol_sum'] if st['vol_sum'] > 0 else c
+
+        st['prev_close'] = c
+
+        return {
+            'ema_fast': st['ema_fast'],
+            'ema_slow': st['ema_slow'],
+            'rsi': rsi,
+            'atr': st['atr'],
+            'vwap': vwap,
+            'price': c,
+            'high': high,
+            'low': low,
+            'time': t_last_s
         }
     
-    def check_cooldown(self, current_time: datetime) -> bool:
+    def check_cooldown(self, current_time: int) -> bool:
         """
         Prevent signal spam by enforcing cooldown period.
-        
+
         Args:
-            current_time: Current bar timestamp
-            
+            current_time: Current bar timestamp (unix seconds)
+
         Returns:
             True if cooldown satisfied
         """
         if self.last_signal_time is None:
             return True
-        
-        time_diff = (current_time - self.last_signal_time).total_seconds() / 60
-        return time_diff >= self.config.COOLDOWN_MINUTES
+
+        return current_time - self.last_signal_time >= self.config.COOLDOWN_MINUTES * 60
     
     def check_spread(self) -> Tuple[bool, float]:
         """
@@ -394,8 +633,7 @@ class SignalGenerator:
         if tick is None:
             return False, 999.0
         
-        point = mt5.symbol_info(self.config.SYMBOL).point
-        spread_pips = (tick.ask - tick.bid) / point / 10
+        spread_pips = (tick.ask - tick.bid) / self._point / 10
         
         return spread_pips <= self.config.MAX_SPREAD_PIPS, spread_pips
     
@@ -421,76 +659,58 @@ class SignalGenerator:
             'failed_conditions': []
         }
         
-        # CONDITION 1: Cooldown
+        # Conditions are ordered cheapest first: attribute compares and the
+        # compiled scalar predicate run before the session lookup, the spread
+        # check (an MT5 IPC round-trip) and the swing scan (an array pass),
+        # so the common NO-TRADE path exits before paying for either.
+
+        # CONDITION 1: Cooldown (pure attribute compare)
         if not self.check_cooldown(indicators['time']):
             signal['failed_conditions'].append(f"Cooldown active ({self.config.COOLDOWN_MINUTES}m)")
             return signal
-        
-        # CONDITION 2: Spread check
-        spread_ok, spread_pips = self.check_spread()
-        if not spread_ok:
-            signal['failed_conditions'].append(f"Spread too wide ({spread_pips:.1f} pips > {self.config.MAX_SPREAD_PIPS})")
+
+        # CONDITIONS 2-5: trend, RSI, VWAP and ATR filters, evaluated by the
+        # config-specialized predicate; failure messages are only formatted
+        # when a condition actually failed
+        fail_mask = self._predicate(
+            indicators['ema_fast'], indicators['ema_slow'],
+            indicators['price'], indicators['rsi'],
+            indicators['vwap'], indicators['atr']
+        )
+        if fail_mask:
+            signal['failed_conditions'].extend(
+                self._describe_failures(fail_mask, indicators)
+            )
             return signal
-        
-        # CONDITION 3: Session filter
+
+        # CONDITION 6: Session filter (the one place a datetime is needed)
         in_session, session_name = SessionFilter.is_trading_session(
-            indicators['time'].to_pydatetime(),
+            datetime.utcfromtimestamp(indicators['time']),
             self.config
         )
         if not in_session:
             signal['failed_conditions'].append(f"Outside trading hours (current: {session_name})")
             return signal
-        
+
         signal['session'] = session_name
-        
-        # CONDITION 4: News filter (manual override available)
+
+        # CONDITION 7: News filter (manual override available)
         if self.config.ENABLE_NEWS_FILTER:
             # User must manually disable if trading during news
             signal['reasoning'].append("News filter: ENABLED (manual override required for news trading)")
-        
-        # CONDITION 5: Trend filter
-        trend_valid = MarketStructure.is_uptrend(
-            indicators['ema_fast'],
-            indicators['ema_slow'],
-            indicators['price']
-        )
-        if not trend_valid:
-            signal['failed_conditions'].append(
-                f"No uptrend (EMA{self.config.EMA_FAST}={indicators['ema_fast']:.5f}, "
-                f"EMA{self.config.EMA_SLOW}={indicators['ema_slow']:.5f}, Price={indicators['price']:.5f})"
-            )
-            return signal
-        
-        # CONDITION 6: RSI filter
-        rsi_valid = self.config.RSI_LOWER < indicators['rsi'] < self.config.RSI_UPPER
-        if not rsi_valid:
-            signal['failed_conditions'].append(
-                f"RSI out of range ({indicators['rsi']:.1f} not in {self.config.RSI_LOWER}-{self.config.RSI_UPPER})"
-            )
-            return signal
-        
-        # CONDITION 7: VWAP filter
-        vwap_valid = indicators['price'] > indicators['vwap']
-        if not vwap_valid:
-            signal['failed_conditions'].append(
-                f"Price below VWAP (Price={indicators['price']:.5f}, VWAP={indicators['vwap']:.5f})"
-            )
-            return signal
-        
-        # CONDITION 8: Volatility filter
-        atr_valid = indicators['atr'] > self.config.MIN_ATR_MULTIPLIER
-        if not atr_valid:
-            signal['failed_conditions'].append(
-                f"ATR too low ({indicators['atr']:.5f} < {self.config.MIN_ATR_MULTIPLIER})"
-            )
+
+        # CONDITION 8: Spread check (MT5 IPC round-trip)
+        spread_ok, spread_pips = self.check_spread()
+        if not spread_ok:
+            signal['failed_conditions'].append(f"Spread too wide ({spread_pips:.1f} pips > {self.config.MAX_SPREAD_PIPS})")
             return signal
-        
+
         # CONDITION 9: Market structure (higher low)
         swing_low = MarketStructure.find_swing_low(indicators['high'], indicators['low'])
         if swing_low is None:
             signal['failed_conditions'].append("No valid higher low pattern detected")
             return signal
-        
+
         # ALL CONDITIONS PASSED - GENERATE SIGNAL
         entry_price = indicators['price']
         
@@ -503,8 +723,7 @@ class SignalGenerator:
         take_profit = entry_price + (risk_distance * self.config.RISK_REWARD_RATIO)
         
         # Convert to pips
-        point = mt5.symbol_info(self.config.SYMBOL).point
-        risk_pips = risk_distance / point / 10
+        risk_pips = risk_distance / self._point / 10
         
         # Update signal
         signal['signal'] = 'BUY'
@@ -524,7 +743,7 @@ class SignalGenerator:
         ]
         
         # Update tracking
-        self.last_signal_time = indicators['time'].to_pydatetime()
+        self.last_signal_time = indicators['time']
         
         return signal
 
@@ -533,104 +752,147 @@ class SignalGenerator:
 # SIGNAL OUTPUT AND LOGGING
 # ============================================================================
 
+_RULE = "=" * 80
+_SUBRULE = "-" * 80
+
+# One preformatted template so printing a signal is a single stdout write
+# instead of ~25 print calls
+_SIGNAL_TEMPLATE = """
+{rule}
+MT5 MANUAL TRADING SIGNAL
+{rule}
+SYMBOL:          {symbol}
+TIMEFRAME:       M5
+TIMESTAMP:       {timestamp}
+SESSION:         {session}
+{subrule}
+SIGNAL:          {signal}
+ENTRY:           {entry:.5f}
+STOP LOSS:       {stop_loss:.5f}
+TAKE PROFIT:     {take_profit:.5f}
+RISK (pips):     {risk_pips:.1f}
+{subrule}
+TREND STATUS:    {trend_status}
+{subrule}
+INDICATOR VALUES:
+  EMA 20:        {ema_fast:.5f}
+  EMA 50:        {ema_slow:.5f}
+  RSI:           {rsi:.1f}
+  ATR:           {atr:.5f}
+  VWAP:          {vwap:.5f}
+  Current Price: {price:.5f}
+{subrule}
+{details}
+{rule}
+
+⚠️  DISCLAIMER: This is NOT a buy/sell recommendation.
+    Execute trades at your own discretion and risk.
+{rule}
+
+"""
+
+
 class SignalLogger:
     """
     Professional signal output formatting and CSV logging.
+
+    Holds the CSV file open for the lifetime of the process so each signal
+    costs a single buffered write instead of an open/stat/close cycle.
     """
-    
-    @staticmethod
-    def print_signal(signal: Dict, indicators: Dict):
+
+    HEADER = [
+        'Timestamp', 'Symbol', 'Signal', 'Entry', 'StopLoss',
+        'TakeProfit', 'RiskPips', 'Session', 'Reasoning'
+    ]
+
+    # Fixed 9-column schema with known-safe values: one template format plus
+    # one write() per row, no csv-module quoting analysis
+    _LINE_FMT = "{},{},{},{:.5f},{:.5f},{:.5f},{:.1f},{},{}\n"
+
+    def __init__(self, path: str):
+        self._path = path
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+        if os.path.getsize(path) == 0:
+            os.write(self._fd, (','.join(self.HEADER) + '\n').encode('utf-8'))
+
+    def log(self, signal: Dict):
         """
-        Print formatted signal to console.
-        
+        Append a signal row to the CSV journal with a single atomic write.
+
         Args:
             signal: Signal dictionary
-            indicators: Indicator values
         """
-        print("\n" + "=" * 80)
-        print("MT5 MANUAL TRADING SIGNAL")
-        print("=" * 80)
-        print(f"SYMBOL:          {signal['symbol']}")
-        print(f"TIMEFRAME:       M5")
-        print(f"TIMESTAMP:       {signal['timestamp']}")
-        print(f"SESSION:         {signal.get('session', 'N/A')}")
-        print("-" * 80)
-        print(f"SIGNAL:          {signal['signal']}")
-        print(f"ENTRY:           {signal['entry']:.5f}")
-        print(f"STOP LOSS:       {signal['stop_loss']:.5f}")
-        print(f"TAKE PROFIT:     {signal['take_profit']:.5f}")
-        print(f"RISK (pips):     {signal['risk_pips']:.1f}")
-        print("-" * 80)
-        print("TREND STATUS:    ", end="")
-        if signal['signal'] == 'BUY':
-            print("UPTREND CONFIRMED")
-        else:
-            print("NO VALID TREND")
-        print("-" * 80)
-        print("INDICATOR VALUES:")
-        print(f"  EMA 20:        {indicators.get('ema_fast', 0):.5f}")
-        print(f"  EMA 50:        {indicators.get('ema_slow', 0):.5f}")
-        print(f"  RSI:           {indicators.get('rsi', 0):.1f}")
-        print(f"  ATR:           {indicators.get('atr', 0):.5f}")
-        print(f"  VWAP:          {indicators.get('vwap', 0):.5f}")
-        print(f"  Current Price: {indicators.get('price', 0):.5f}")
-        print("-" * 80)
-        
-        if signal['signal'] == 'NO TRADE':
-            print("FAILED CONDITIONS:")
-            for condition in signal['failed_conditions']:
-                print(f"  ✗ {condition}")
-        else:
-            print("REASONING:")
-            for reason in signal['reasoning']:
-                print(f"  ✓ {reason}")
-        
-        print("=" * 80)
-        print("\n⚠️  DISCLAIMER: This is NOT a buy/sell recommendation.")
-        print("    Execute trades at your own discretion and risk.")
-        print("=" * 80 + "\n")
-    
+        try:
+            reasoning = '; '.join(signal['reasoning']) if signal['reasoning'] else 'N/A'
+            # Keep the fixed column layout parseable without quoting
+            reasoning = reasoning.replace(',', ';')
+
+            line = self._LINE_FMT.format(
+                datetime.utcfromtimestamp(signal['timestamp']),
+                signal['symbol'],
+                signal['signal'],
+                signal['entry'],
+                signal['stop_loss'],
+                signal['take_profit'],
+                signal['risk_pips'],
+                signal.get('session', 'N/A'),
+                reasoning
+            )
+            os.write(self._fd, line.encode('utf-8'))
+
+            print(f"✓ Signal logged to {self._path}")
+
+        except Exception as e:
+            print(f"❌ ERROR logging to CSV: {e}")
+
+    def close(self):
+        """Close the log file descriptor (safe to call more than once)."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
     @staticmethod
-    def log_to_csv(signal: Dict, config: TradingConfig):
+    def print_signal(signal: Dict, indicators: Dict):
         """
-        Append signal to CSV log file for journaling.
-        
+        Print formatted signal to console with a single write.
+
         Args:
             signal: Signal dictionary
-            config: Trading configuration
+            indicators: Indicator values
         """
-        file_exists = os.path.isfile(config.LOG_FILE)
-        
-        try:
-            with open(config.LOG_FILE, 'a', newline='') as f:
-                writer = csv.writer(f)
-                
-                if not file_exists:
-                    # Write header
-                    writer.writerow([
-                        'Timestamp', 'Symbol', 'Signal', 'Entry', 'StopLoss',
-                        'TakeProfit', 'RiskPips', 'Session', 'Reasoning'
-                    ])
-                
-                # Write signal
-                reasoning = '; '.join(signal['reasoning']) if signal['reasoning'] else 'N/A'
-                writer.writerow([
-                    signal['timestamp'],
-                    signal['symbol'],
-                    signal['signal'],
-                    signal['entry'],
-                    signal['stop_loss'],
-                    signal['take_profit'],
-                    signal['risk_pips'],
-                    signal.get('session', 'N/A'),
-                    reasoning
-                ])
-                
-            print(f"✓ Signal logged to {config.LOG_FILE}")
-            
-        except Exception as e:
-            print(f"❌ ERROR logging to CSV: {e}")
+        if signal['signal'] == 'NO TRADE':
+            trend_status = "NO VALID TREND"
+            details = "FAILED CONDITIONS:\n" + '\n'.join(
+                f"  ✗ {condition}" for condition in signal['failed_conditions']
+            )
+        else:
+            trend_status = "UPTREND CONFIRMED"
+            details = "REASONING:\n" + '\n'.join(
+                f"  ✓ {reason}" for reason in signal['reasoning']
+            )
 
+        sys.stdout.write(_SIGNAL_TEMPLATE.format(
+            rule=_RULE,
+            subrule=_SUBRULE,
+            symbol=signal['symbol'],
+            timestamp=datetime.utcfromtimestamp(signal['timestamp']),
+            session=signal.get('session', 'N/A'),
+            signal=signal['signal'],
+            entry=signal['entry'],
+            stop_loss=signal['stop_loss'],
+            take_profit=signal['take_profit'],
+            risk_pips=signal['risk_pips'],
+            trend_status=trend_status,
+            ema_fast=indicators.get('ema_fast', 0),
+            ema_slow=indicators.get('ema_slow', 0),
+            rsi=indicators.get('rsi', 0),
+            atr=indicators.get('atr', 0),
+            vwap=indicators.get('vwap', 0),
+            price=indicators.get('price', 0),
+            details=details
+        ))
+    
 
 # ============================================================================
 # MT5 CONNECTION MANAGER
@@ -742,23 +1004,25 @@ def main():
     print(f"  Risk:Reward: 1:{config.RISK_REWARD_RATIO}")
     print(f"  News Filter: {'ENABLED' if config.ENABLE_NEWS_FILTER else 'DISABLED'}")
     
-    # Initialize signal generator
+    # Initialize signal generator and logger
     generator = SignalGenerator(config)
-    
+    logger = SignalLogger(config.LOG_FILE)
+    atexit.register(logger.close)
+
     try:
         print("\n" + "=" * 80)
         print("GENERATING SIGNAL...")
         print("=" * 80 + "\n")
         
         # Fetch market data
-        df = generator.get_market_data()
-        if df is None:
+        rates = generator.get_market_data()
+        if rates is None:
             raise Exception("Failed to retrieve market data")
-        
-        print(f"✓ Retrieved {len(df)} bars of data")
-        
+
+        print(f"✓ Retrieved {len(rates)} bars of data")
+
         # Calculate indicators
-        indicators = generator.calculate_indicators(df)
+        indicators = generator.calculate_indicators()
         print("✓ Indicators calculated")
         
         # Evaluate signal
@@ -769,7 +1033,7 @@ def main():
         
         # Log to CSV (only if valid signal or for record keeping)
         if signal['signal'] == 'BUY':
-            SignalLogger.log_to_csv(signal, config)
+            logger.log(signal)
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Signal generation interrupted by user")